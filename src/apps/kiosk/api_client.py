@@ -17,6 +17,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Kiosk on-disk cache (photos/, map tiles): resolved once, shared by app and checkin_screen
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
+
 
 class RemoteServiceError(Exception):
     """Raised when a remote API request fails in an unrecoverable way."""
@@ -85,9 +88,17 @@ class LocalTimeService:
 
     def __init__(self, base_url: str):
         self._base = base_url.rstrip("/")
+        # get_time is polled every second but only changes once a minute
+        self._time_minute = None
+        self._time_text = ""
 
     def get_time(self) -> str:
-        return datetime.now().strftime("%-I:%M %p").replace(" 0", " ").lstrip()
+        now = datetime.now()
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._time_minute:
+            self._time_minute = minute
+            self._time_text = now.strftime("%-I:%M %p").replace(" 0", " ").lstrip()
+        return self._time_text
 
     def get_dayof_week(self) -> str:
         return datetime.now().strftime("%A")
@@ -407,15 +418,16 @@ class RemoteLocationService:
 
     def fetch_photo_to_cache(self, user_id: str, cache_dir: str) -> Optional[str]:
         """Fetch photo from server and save to cache. Returns local path or None. Reuses cache if present. user_id = whose photo (any family member)."""
+        photo_dir = os.path.join(cache_dir, "photos")
+        cached = os.path.join(photo_dir, user_id)
+        # Cache hit (boot sync already ran) costs one stat: no makedirs, no requests import
+        if os.path.exists(cached):
+            return cached
         try:
             import requests
         except ImportError:
             return None
-        photo_dir = os.path.join(cache_dir, "photos")
         os.makedirs(photo_dir, exist_ok=True)
-        cached = os.path.join(photo_dir, user_id)
-        if os.path.exists(cached):
-            return cached
         try:
             url = f"{self._base}/api/users/{user_id}/photo"
             client = self._session if self._session else requests
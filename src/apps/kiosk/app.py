@@ -10,8 +10,7 @@ SERVER DEPLOYMENT: app_factory.py is not needed on the server; the server uses s
 """
 
 import logging
-import os
-from .api_client import create_kiosk_remote
+from .api_client import CACHE_DIR, create_kiosk_remote
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager
 from kivy.clock import Clock
@@ -28,6 +27,14 @@ class MeridianKioskApp(App):
         super().__init__(**kwargs)
         self.services = services
         self.screen_manager = None
+        # Home screen widgets; None until the home screen is built
+        self.home_screen = None
+        self._clock_widget = None
+        self._med_widget = None
+        self._events_widget = None
+        self._last_events = None
+        # Time-of-day period last painted on the clock; None until the first paint
+        self._last_time_of_day = None
 
     def build(self):
         """Build the application UI using modular components."""
@@ -47,30 +54,50 @@ class MeridianKioskApp(App):
             family_circle_id=self.family_circle_id,
         )
 
-        self.screen_manager.add_widget(screen_factory.create_emergency_screen())
-        self.screen_manager.add_widget(screen_factory.create_checkin_screen())
+        # Only the initial screen is built before the first frame; the rest are queued
+        # one per frame so the window paints instead of blocking on the whole tree
         self.screen_manager.add_widget(screen_factory.create_chat_screen())
-        self.home_screen, self._clock_widget, self._med_widget, self._events_widget = (
-            screen_factory.create_home_screen()
-        )
-        self.screen_manager.add_widget(self.home_screen)
         self.screen_manager.current = "chat"
+        self._pending_screens = [
+            lambda: self._add_home_screen(screen_factory),
+            lambda: self.screen_manager.add_widget(
+                screen_factory.create_emergency_screen()
+            ),
+            lambda: self.screen_manager.add_widget(
+                screen_factory.create_checkin_screen()
+            ),
+        ]
+        Clock.schedule_once(self._build_next_screen, 0)
 
         # Sync photos on boot: fetch from server and cache locally for offline use
         Clock.schedule_once(lambda dt: self._sync_photos_on_boot(), 1.0)
-        # Full clock refresh on boot (day, date, year)
-        Clock.schedule_once(lambda dt: self.refresh_clock(), 1.0)
         # Per-second tick: time digits + time-of-day when period changes
         Clock.schedule_interval(self._tick_clock, 1.0)
         # Poll alert status: when activated, switch TV to emergency screen and enable flashing
         Clock.schedule_interval(self._check_alert_status, 2.0)
 
+        return self.screen_manager
+
+    def _build_next_screen(self, dt=None):
+        """Build one queued screen, then yield to the event loop before the next."""
+        if self._pending_screens:
+            self._pending_screens.pop(0)()
+        if self._pending_screens:
+            Clock.schedule_once(self._build_next_screen, 0)
+
+    def _add_home_screen(self, screen_factory):
+        """Build the home screen and schedule its boot data loads."""
+        self.home_screen, self._clock_widget, self._med_widget, self._events_widget = (
+            screen_factory.create_home_screen()
+        )
+        self.screen_manager.add_widget(self.home_screen)
+
+        # Full clock refresh on boot (day, date, year)
+        Clock.schedule_once(lambda dt: self.refresh_clock(), 1.0)
         # Load medications and events on boot
         Clock.schedule_once(lambda dt: self._load_medications(), 1.5)
         Clock.schedule_once(lambda dt: self._load_events(), 1.5)
 
-        return self.screen_manager
-
     def _check_alert_status(self, dt=None):
         """Poll alert API; when activated, switch to emergency screen, enable flashing, and auto-print."""
         alert_svc = self.services.get("alert_service")
@@ -82,8 +109,14 @@ class MeridianKioskApp(App):
         activated = result.data.get("activated", False) if result.data else False
         was_activated = getattr(self, "_alert_was_activated", False)
         self.services["_alert_activated"][0] = activated
+        if activated != was_activated:
+            set_border_flash = self.services.get("_emergency_border_flash")
+            if set_border_flash:
+                set_border_flash(activated)
         if activated and self.screen_manager:
-            self.screen_manager.current = "emergency"
+            # The emergency screen is built a few frames after boot; switch on a later poll if not yet
+            if self.screen_manager.has_screen("emergency"):
+                self.screen_manager.current = "emergency"
             if not was_activated:
                 from .emergency_print import trigger_emergency_print
 
@@ -100,10 +133,9 @@ class MeridianKioskApp(App):
         result = loc_svc.get_checkins()
         if not result.success or not result.data:
             return
-        cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
         for checkin in result.data:
             if checkin.get("photo_url") and checkin.get("user_id"):
-                loc_svc.fetch_photo_to_cache(checkin["user_id"], cache_dir)
+                loc_svc.fetch_photo_to_cache(checkin["user_id"], CACHE_DIR)
 
     def update_all(self):
         """Update all display elements."""
@@ -112,42 +144,50 @@ class MeridianKioskApp(App):
         self._load_events()
 
     def _tick_clock(self, dt=1):
-        """Per-second clock tick: time digits + time-of-day label/icon when period changes."""
-        if not hasattr(self, "_clock_widget") or not self._clock_widget:
+        """Per-second clock tick: time digits; time-of-day, day, date, year only when the period changes."""
+        if self._clock_widget is None:
             return
         cw = self._clock_widget
         time_svc = self.services.get("time_service")
         if not time_svc:
             return
 
+        # Kivy skips re-rendering when the text is unchanged, so this only repaints on minute change
         cw.time_label.text = time_svc.get_time()
         current_time_of_day = time_svc.get_am_pm()
-        if not hasattr(self, "_last_time_of_day"):
-            self._last_time_of_day = current_time_of_day
         if current_time_of_day != self._last_time_of_day:
-            self._last_time_of_day = current_time_of_day
-            cw.time_of_day_label.text = current_time_of_day.upper()
-            if hasattr(cw, "time_of_day_icon"):
-                cw.time_of_day_icon.source = get_time_of_day_icon(current_time_of_day)
+            # Dirty: first tick or period flip (Evening -> Morning is also the date rollover)
+            self._paint_time_of_day(cw, current_time_of_day)
+            self._refresh_date_labels(cw, time_svc)
+
+    def _paint_time_of_day(self, cw, time_of_day):
+        """Time-of-day label and icon; remembers the painted period for _tick_clock."""
+        self._last_time_of_day = time_of_day
+        cw.time_of_day_label.text = time_of_day.upper()
+        cw.time_of_day_icon.source = get_time_of_day_icon(time_of_day)
+
+    def _refresh_date_labels(self, cw, time_svc):
+        """Day, date, year labels."""
+        cw.day_label.text = time_svc.get_dayof_week().upper()
+        cw.date_label.text = time_svc.get_month_day()
+        cw.year_label.text = time_svc.get_year()
 
     def refresh_clock(self):
-        """Full clock refresh: day, date, year, then per-second tick."""
-        if not hasattr(self, "_clock_widget") or not self._clock_widget:
+        """Full clock refresh: time, time-of-day, day, date, year."""
+        if self._clock_widget is None:
             return
         cw = self._clock_widget
         time_svc = self.services.get("time_service")
         if not time_svc:
             return
 
-        cw.day_label.text = time_svc.get_dayof_week().upper()
-        cw.date_label.text = time_svc.get_month_day()
-        if hasattr(cw, "year_label"):
-            cw.year_label.text = time_svc.get_year()
-        self._tick_clock()
+        cw.time_label.text = time_svc.get_time()
+        self._paint_time_of_day(cw, time_svc.get_am_pm())
+        self._refresh_date_labels(cw, time_svc)
 
     def _load_medications(self):
         """Load medication data."""
-        if self.services.get("medication_service") and hasattr(self, "home_screen"):
+        if self.services.get("medication_service") and self._med_widget is not None:
             result = self.services["medication_service"].get_medication_data()
             if result.success:
                 # Group medications by time period
@@ -186,60 +226,40 @@ class MeridianKioskApp(App):
                         )
                         meds_text.append(f"  • {med['name']}: {last_taken}")
 
-                # Find medication widget in nested structure
-                self._find_and_update_widget(
-                    self.home_screen,
-                    "medication_content",
-                    "\n".join(meds_text) if meds_text else "No medications",
+                self._med_widget.medication_content.text = (
+                    "\n".join(meds_text) if meds_text else "No medications"
                 )
             else:
-                # Find medication widget and show error
-                self._find_and_update_widget(
-                    self.home_screen, "medication_content", "Error loading medications"
-                )
+                self._med_widget.medication_content.text = "Error loading medications"
 
     def _load_events(self):
         """Load events data."""
         logger = logging.getLogger(__name__)
-        if self.services.get("calendar_service") and hasattr(self, "home_screen"):
-            today = datetime.datetime.now()
-            logger.debug(
-                f"Loading events for today: {today.strftime('%Y-%m-%d')} (day={today.day})"
-            )
-            result = self.services["calendar_service"].get_events_for_date(
-                today.strftime("%Y-%m-%d")
-            )
+        if self.services.get("calendar_service") and self._events_widget is not None:
+            # One ISO date per load; logging args are only formatted when DEBUG is enabled
+            today_iso = datetime.date.today().isoformat()
+            logger.debug("Loading events for today: %s", today_iso)
+            result = self.services["calendar_service"].get_events_for_date(today_iso)
 
             logger.debug(
-                f"Events query result: success={result.success}, data_count={len(result.data) if result.data else 0}"
+                "Events query result: success=%s, data_count=%d",
+                result.success,
+                len(result.data) if result.data else 0,
             )
             if result.data:
-                logger.debug(f"Events found: {result.data}")
-
-            if result.success and result.data:
-                events_text = [f"• {event}" for event in result.data]
-                # Find events widget in nested structure
-                self._find_and_update_widget(
-                    self.home_screen, "events_content", "\n".join(events_text)
-                )
+                logger.debug("Events found: %s", result.data)
+
+            events = tuple(result.data) if result.success and result.data else ()
+            # Same list as the last load: the label already shows it, skip the join
+            if events == self._last_events:
+                return
+            self._last_events = events
+            if events:
+                # Events arrive as display strings: one join, no per-item f-string
+                self._events_widget.events_content.text = "• " + "\n• ".join(events)
             else:
-                # Find events widget and show no events
-                logger.debug(f"No events found for today, showing 'No events today'")
-                self._find_and_update_widget(
-                    self.home_screen, "events_content", "No events today"
-                )
-
-    def _find_and_update_widget(self, parent, attribute_name, text):
-        """Recursively find widget with specific attribute and update its text."""
-        for child in parent.children:
-            if hasattr(child, attribute_name):
-                getattr(child, attribute_name).text = text
-                return True
-            # Recursively search in child widgets
-            if hasattr(child, "children"):
-                if self._find_and_update_widget(child, attribute_name, text):
-                    return True
-        return False
+                logger.debug("No events found for today, showing 'No events today'")
+                self._events_widget.events_content.text = "No events today"
 
 
 def create_app(
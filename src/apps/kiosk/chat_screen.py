@@ -1,16 +1,33 @@
 """
 Chat screen: contact grid with chat entry. Uses KioskLabel/KioskButton for dementia-friendly styling.
+Contact grid is a RecycleView: a handful of recycled buttons regardless of family size.
 """
 
 from kivy.metrics import dp
+from kivy.properties import ObjectProperty, StringProperty
 from kivy.uix.boxlayout import BoxLayout
-from kivy.uix.scrollview import ScrollView
-from kivy.uix.gridlayout import GridLayout
+from kivy.uix.recyclegridlayout import RecycleGridLayout
+from kivy.uix.recycleview import RecycleView
 
 from .screen_primitives import KioskLabel, KioskButton
 from .webview import open_chat_window
 
 
+class ChatContactButton(KioskButton):
+    """Recycled contact cell. RecycleView data keys: text, sendbird_user_id, open_chat."""
+
+    sendbird_user_id = StringProperty("")
+    open_chat = ObjectProperty(None, allownone=True)
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("font_size", KioskLabel._TYPES["body"]["font_size"])
+        super().__init__(**kwargs)
+
+    def on_press(self):
+        if self.open_chat is not None:
+            self.open_chat(self.sendbird_user_id, self.text)
+
+
 def build_chat_screen(services, kiosk_user_id: str, family_circle_id: str, screen):
     """Build fully constructed chat screen content widget. Wires on_enter to load contacts."""
     content = BoxLayout(orientation="vertical", padding=dp(24), spacing=dp(24))
@@ -19,69 +36,60 @@ def build_chat_screen(services, kiosk_user_id: str, family_circle_id: str, scree
             type="subheader", text="Family Chat", size_hint_y=None, height=dp(48)
         )
     )
-    contacts_grid = GridLayout(cols=3, spacing=dp(12), size_hint_y=None, padding=dp(8))
+    status = KioskLabel(type="body", text="", size_hint_y=None, height=0)
+    content.add_widget(status)
+
+    contacts_grid = RecycleGridLayout(
+        cols=3,
+        spacing=dp(12),
+        padding=dp(8),
+        size_hint_y=None,
+        default_size=(None, dp(64)),
+        default_size_hint=(1, None),
+    )
     contacts_grid.bind(minimum_height=contacts_grid.setter("height"))
-    scroll = ScrollView(size_hint=(1, 1))
-    scroll.add_widget(contacts_grid)
-    content.add_widget(scroll)
+    contacts_view = RecycleView(size_hint=(1, 1))
+    contacts_view.add_widget(contacts_grid)
+    contacts_view.viewclass = ChatContactButton
+    content.add_widget(contacts_view)
+
+    def _show_status(text):
+        status.text = text
+        status.height = dp(48) if text else 0
+
+    def _open_chat(sb, nm):
+        entry_svc = services.get("chat_entry_service")
+        if entry_svc and kiosk_user_id and family_circle_id:
+            r = entry_svc.get_entry_url(
+                recipient_sendbird_user_id=sb,
+                recipient_display_name=nm,
+            )
+            if r.success and r.data:
+                open_chat_window(r.data)
 
     def _load_contacts():
-        contacts_grid.clear_widgets()
+        contacts_view.data = []
         contact_svc = services.get("contact_service") if services else None
         if not contact_svc or not family_circle_id:
-            contacts_grid.add_widget(
-                KioskLabel(
-                    type="body",
-                    text="No contacts (check server).",
-                    size_hint_y=None,
-                    height=dp(48),
-                )
-            )
+            _show_status("No contacts (check server).")
             return
         r = contact_svc.get_contacts()
         if not r.success or not r.data:
-            contacts_grid.add_widget(
-                KioskLabel(
-                    type="body",
-                    text="No contacts.",
-                    size_hint_y=None,
-                    height=dp(48),
-                )
-            )
+            _show_status("No contacts.")
             return
         chat_contacts = [c for c in r.data if (c.get("sendbird_user_id") or "").strip()]
         if not chat_contacts:
-            contacts_grid.add_widget(
-                KioskLabel(
-                    type="body",
-                    text="No contacts with chat.",
-                    size_hint_y=None,
-                    height=dp(48),
-                )
-            )
+            _show_status("No contacts with chat.")
             return
-        entry_svc = services.get("chat_entry_service")
-        for c in chat_contacts:
-            name = c.get("display_name") or c.get("id") or "Contact"
-            sb_uid = (c.get("sendbird_user_id") or "").strip()
-
-            def _on_contact_click(sb, nm):
-                if entry_svc and kiosk_user_id and family_circle_id:
-                    r = entry_svc.get_entry_url(
-                        recipient_sendbird_user_id=sb,
-                        recipient_display_name=nm,
-                    )
-                    if r.success and r.data:
-                        open_chat_window(r.data)
-
-            btn = KioskButton(
-                text=name,
-                size_hint_y=None,
-                height=dp(64),
-                font_size=KioskLabel._TYPES["body"]["font_size"],
-            )
-            btn.bind(on_press=lambda *_a, sb=sb_uid, nm=name: _on_contact_click(sb, nm))
-            contacts_grid.add_widget(btn)
+        _show_status("")
+        contacts_view.data = [
+            {
+                "text": c.get("display_name") or c.get("id") or "Contact",
+                "sendbird_user_id": (c.get("sendbird_user_id") or "").strip(),
+                "open_chat": _open_chat,
+            }
+            for c in chat_contacts
+        ]
 
-    screen.bind(on_enter=lambda *_a: _load_contacts())
+    screen.fbind("on_enter", lambda *_a: _load_contacts())
     return content
@@ -1,127 +1,156 @@
 """
 Check-in (family locations / map) screen. Title, columns, map with markers.
-MapView is lazy-loaded on screen enter.
+Service data and MapView are lazy-loaded on screen enter; kivy_garden.mapview and PIL are imported on first use.
 """
 
 import os
 import logging
+from functools import lru_cache, partial
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from kivy.clock import Clock
 from kivy.metrics import dp
 from kivy.uix.boxlayout import BoxLayout
-from kivy_garden.mapview import MapView, MapMarker
 
-from .screen_primitives import KioskLabel, KioskWidget, apply_debug_border
+from .api_client import CACHE_DIR
+from .screen_primitives import KioskLabel, KioskWidget, apply_debug_borders
 
 logger = logging.getLogger(__name__)
 
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_BASE_DIR = os.path.normpath(os.path.join(_MODULE_DIR, "..", ".."))
+
+# PIL decode/resize/save for marker photos runs here, off the Kivy main thread
+_photo_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="checkin-photo")
+
 
 def _create_title():
     """Create Family Locations screen title block."""
-    title = KioskLabel(type="header", text="Family Locations")
-    title.size_hint_y = None
-    title.height = 70
-    apply_debug_border(title)
-    return title
-
-
-def _create_possible_places_block(location_service):
-    """Create possible family locations block (debug)."""
-    prefix = "possible family locations:\n"
-    if location_service:
-        places_result = location_service.get_named_places()
-        if places_result.success and places_result.data:
-            lines = []
-            for p in places_result.data:
-                lat, lon = p.get("gps_latitude"), p.get("gps_longitude")
-                coords = (
-                    f"{lat:.6f},{lon:.6f}"
-                    if lat is not None and lon is not None
-                    else "—"
-                )
-                lines.append(f"• {p.get('location_name', 'Unknown')}:\n   {coords}")
-            suffix = "\n".join(lines)
-        else:
-            suffix = "(none)"
-    else:
-        suffix = "(unavailable)"
-    widget = KioskLabel(type="body", text=prefix + suffix, shorten=False)
-    widget.size_hint_x = 0.5
-    apply_debug_border(widget)
-    return widget
+    return KioskLabel(
+        type="header", text="Family Locations", size_hint_y=None, height=70
+    )
+
+
+_PLACES_PREFIX = "possible family locations:\n"
+
+
+def _places_text(location_service):
+    """Text for the possible family locations block (debug)."""
+    if not location_service:
+        return _PLACES_PREFIX + "(unavailable)"
+    places_result = location_service.get_named_places()
+    if not places_result.success or not places_result.data:
+        return _PLACES_PREFIX + "(none)"
+    lines = []
+    for p in places_result.data:
+        lat, lon = p.get("gps_latitude"), p.get("gps_longitude")
+        coords = f"{lat:.6f},{lon:.6f}" if lat is not None and lon is not None else "—"
+        lines.append(f"• {p.get('location_name', 'Unknown')}:\n   {coords}")
+    return _PLACES_PREFIX + "\n".join(lines)
+
+
+def _create_possible_places_block():
+    """Create possible family locations block (debug); filled on first screen enter."""
+    return KioskLabel(
+        type="body",
+        text=_PLACES_PREFIX + "(loading…)",
+        shorten=False,
+        size_hint_x=0.5,
+    )
+
+
+# Server rows always carry these columns: one C-level fetch per check-in
+_CHECKIN_FIELDS = itemgetter("contact_name", "location_name", "latitude", "longitude")
 
 
-def _create_checkins_block(location_service):
-    """Create family check-ins block."""
-    line_h = 32 + 4
-    if location_service:
-        result = location_service.get_checkins()
-        if result.success and result.data:
-            checkins_text = []
-            for checkin in result.data:
-                contact_name = checkin.get("contact_name", "Unknown")
-                location = checkin.get("location_name", None)
-
-                if not location:
-                    lat = checkin.get("latitude")
-                    lon = checkin.get("longitude")
-                    location = (
-                        f"{lat:.6f}, {lon:.6f}"
-                        if lat is not None and lon is not None
-                        else "Unknown location"
-                    )
-
-                time_str = datetime.now().strftime("%H:%M")
-
-                lines = [f"• {contact_name}", f"  {location} at {time_str}"]
-                checkins_text.append("\n".join(lines))
-
-            n_lines = (
-                sum(c.count("\n") + 1 for c in checkins_text)
-                + (len(checkins_text) - 1) * 2
+def _checkin_fields(checkin):
+    """(contact_name, location_name, latitude, longitude); .get fallbacks for partial dicts."""
+    try:
+        return _CHECKIN_FIELDS(checkin)
+    except KeyError:
+        return (
+            checkin.get("contact_name", "Unknown"),
+            checkin.get("location_name"),
+            checkin.get("latitude"),
+            checkin.get("longitude"),
+        )
+
+
+def _checkins_text(checkins):
+    """Text for the family check-ins block. checkins is None when unavailable."""
+    if checkins is None:
+        return "Location service not available"
+    if not checkins:
+        return "No family check-ins yet"
+    checkins_text = []
+    time_str = f"{datetime.now():%H:%M}"
+    for checkin in checkins:
+        contact_name, location, lat, lon = _checkin_fields(checkin)
+        if not location:
+            location = (
+                f"{lat:.6f}, {lon:.6f}"
+                if lat is not None and lon is not None
+                else "Unknown location"
             )
-            text = "\n\n".join(checkins_text)
-        else:
-            n_lines = 2
-            text = "No family check-ins yet"
 
-    else:
-        n_lines = 2
-        text = "Location service not available"
+        checkins_text.append(f"• {contact_name}\n  {location} at {time_str}")
 
-    widget = KioskLabel(type="body", text=text, shorten=False)
-    widget.size_hint_x = 0.5
-    widget.height = max(120, int(n_lines * line_h))
-    apply_debug_border(widget)
-    return widget
+    return "\n\n".join(checkins_text)
+
+
+def _create_checkins_block():
+    """Create family check-ins block; filled on first screen enter."""
+    return KioskLabel(
+        type="body",
+        text="Loading check-ins…",
+        shorten=False,
+        size_hint_x=0.5,
+    )
+
+
+@lru_cache(maxsize=8)
+def _circle_mask(size):
+    """Circular L-mode mask for marker photos; rasterized once per size and reused (read-only)."""
+    from PIL import Image, ImageDraw
+
+    mask = Image.new("L", (size, size), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill=255)
+    return mask
 
 
 def _crop_image_to_circle(src_path, size=200):
     """Crop image to circle; save as PNG. Returns absolute path to output file, or None if source missing."""
-    if not src_path or not os.path.exists(src_path):
+    if not src_path:
         logger.warning(
-            "[family map] Could not load photo for marker: %s",
-            "no path provided" if not src_path else "file not found: %s" % src_path,
+            "[family map] Could not load photo for marker: %s", "no path provided"
         )
         return None
     src_abs = os.path.abspath(src_path)
     out = src_abs.rsplit(".", 1)[0] + "_circle.png"
+    # Cached circle first: the common case needs a single stat
     if os.path.exists(out):
-        return os.path.abspath(out)
-    try:
-        from PIL import Image, ImageDraw
-
-        img = (
-            Image.open(src_abs)
-            .convert("RGBA")
-            .resize((size, size), Image.Resampling.LANCZOS)
+        return out
+    if not os.path.exists(src_abs):
+        logger.warning(
+            "[family map] Could not load photo for marker: %s",
+            "file not found: %s" % src_path,
         )
-        mask = Image.new("L", (size, size), 0)
-        ImageDraw.Draw(mask).ellipse((0, 0, size - 1, size - 1), fill=255)
+        return None
+    try:
+        from PIL import Image
+
+        # Marker renders at ~50dp: let JPEG decode pre-shrink via draft, then cheap bilinear resize
+        with Image.open(src_abs) as src_img:
+            src_img.draft("RGB", (size * 2, size * 2))
+            img = src_img.convert("RGBA")
+        if img.size != (size, size):
+            img = img.resize((size, size), Image.Resampling.BILINEAR)
         out_img = Image.new("RGBA", (size, size), (0, 0, 0, 0))
-        out_img.paste(img, mask=mask)
+        out_img.paste(img, mask=_circle_mask(size))
         out_img.save(out)
-        return os.path.abspath(out)
+        return out
     except Exception as e:
         logger.warning(
             "[family map] Failed to crop photo to circle: %s - %s", src_path, e
@@ -129,89 +158,147 @@ def _crop_image_to_circle(src_path, size=200):
         return None
 
 
-class CustomMarker(MapMarker):
-    """MapMarker with fixed size for Life360-style profile photo display."""
+@lru_cache(maxsize=256)
+def _resolve_photo_path(photo_fn):
+    """Resolve a checkin photo_filename to a path: absolute as-is, else relative to src/."""
+    if not photo_fn:
+        return None
+    if os.path.isabs(photo_fn):
+        return photo_fn
+    return os.path.join(_BASE_DIR, photo_fn)
+
+
+@lru_cache(maxsize=None)
+def _custom_marker_class():
+    """Define CustomMarker on first use so mapview is only imported when the map is shown."""
+    from kivy_garden.mapview import MapMarker
+
+    class CustomMarker(MapMarker):
+        """MapMarker with fixed size for Life360-style profile photo display."""
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.size_hint = (None, None)
+            self.size = (dp(50), dp(50))
+            self.anchor_x = 0.5
+            self.anchor_y = 0
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.size_hint = (None, None)
-        self.size = (dp(50), dp(50))
-        self.anchor_x = 0.5
-        self.anchor_y = 0
+    return CustomMarker
+
+
+def _add_photo_marker(map_view, lat, lon, src):
+    """Crop src to a circle on the photo pool, then add its marker on the main thread."""
+
+    def _on_cropped(future):
+        circle_img = future.result()
+
+        def _add(dt):
+            from kivy_garden.mapview import MapMarker
+
+            if circle_img:
+                custom_marker = _custom_marker_class()
+                map_view.add_marker(custom_marker(lat=lat, lon=lon, source=circle_img))
+            else:
+                map_view.add_marker(MapMarker(lat=lat, lon=lon))
+
+        Clock.schedule_once(_add)
+
+    _photo_pool.submit(_crop_image_to_circle, src).add_done_callback(_on_cropped)
 
 
 def _create_map_container():
     """Create map container; MapView added lazily on screen enter."""
     container = BoxLayout(size_hint_y=0.72)
-    apply_debug_border(container)
     return container
 
 
+def _on_checkin_enter(
+    map_container, loc_svc, map_params, places_block, checkins_block, instance
+):
+    """Screen on_enter: the first time the screen is shown, fetch places and check-ins
+    (one get_checkins for both the text block and the markers) and build the MapView."""
+    if map_container.children:
+        return
+    from kivy_garden.mapview import MapView, MapMarker
+
+    places_block.text = _places_text(loc_svc)
+    checkins = None
+    if loc_svc:
+        result = loc_svc.get_checkins()
+        checkins = result.data if result.success and result.data else []
+    checkins_block.text = _checkins_text(checkins)
+
+    map_view = MapView(
+        lat=map_params["lat"],
+        lon=map_params["lon"],
+        zoom=map_params["zoom"],
+        cache_dir=CACHE_DIR,
+    )
+    markers = []
+    photo_markers = []
+    fetch_photo = getattr(loc_svc, "fetch_photo_to_cache", None)
+    for checkin in checkins or ():
+        lat = checkin.get("latitude")
+        lon = checkin.get("longitude")
+        if lat is None or lon is None:
+            continue
+        src = None
+        photo_url = checkin.get("photo_url")
+        user_id = checkin.get("user_id")
+        if photo_url and user_id and fetch_photo is not None:
+            src = fetch_photo(user_id, CACHE_DIR)
+        if not src:
+            src = _resolve_photo_path(checkin.get("photo_filename"))
+        if src:
+            photo_markers.append((lat, lon, src))
+        else:
+            markers.append(MapMarker(lat=lat, lon=lon))
+    # Attach the map first, then markers in one pass (photo markers follow from the pool)
+    map_container.add_widget(map_view)
+    for marker in markers:
+        map_view.add_marker(marker)
+    for lat, lon, src in photo_markers:
+        _add_photo_marker(map_view, lat, lon, src)
+
+
 def build_checkin_screen(services, screen):
-    """Build fully constructed check-in (family locations) widget. Wires lazy-load MapView on screen enter internally."""
+    """Build fully constructed check-in (family locations) widget. Wires lazy-load of
+    places, check-ins and MapView on screen enter internally."""
     loc_svc = services.get("location_service")
     map_lat = (37.0056 + 37.139) / 2
     map_lon = (-113.503 + -113.599) / 2
     map_params = {"lat": map_lat, "lon": map_lon, "zoom": 11}
-    cache_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache")
-    base = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
 
     widget = KioskWidget(orientation="vertical")
-    apply_debug_border(widget)
 
-    widget.add_widget(_create_title())
+    title = _create_title()
+    widget.add_widget(title)
 
     columns_row = BoxLayout(orientation="horizontal", size_hint_y=0.28)
-    columns_row.add_widget(_create_possible_places_block(loc_svc))
-    columns_row.add_widget(_create_checkins_block(loc_svc))
+    places_block = _create_possible_places_block()
+    columns_row.add_widget(places_block)
+    checkins_block = _create_checkins_block()
+    columns_row.add_widget(checkins_block)
     widget.add_widget(columns_row)
 
     map_container = _create_map_container()
     widget.map_container = map_container
     widget.add_widget(map_container)
 
-    def on_checkin_enter(instance):
-        if map_container.children:
-            return
-        map_view = MapView(
-            lat=map_params["lat"],
-            lon=map_params["lon"],
-            zoom=map_params["zoom"],
-            cache_dir=cache_dir,
-        )
-        if loc_svc:
-            result = loc_svc.get_checkins()
-            if result.success and result.data:
-                for checkin in result.data:
-                    lat = checkin.get("latitude")
-                    lon = checkin.get("longitude")
-                    if lat is None or lon is None:
-                        continue
-                    src = None
-                    photo_url = checkin.get("photo_url")
-                    user_id = checkin.get("user_id")
-                    if (
-                        photo_url
-                        and user_id
-                        and hasattr(loc_svc, "fetch_photo_to_cache")
-                    ):
-                        src = loc_svc.fetch_photo_to_cache(user_id, cache_dir)
-                    if not src:
-                        photo_fn = checkin.get("photo_filename")
-                        if photo_fn and os.path.isabs(photo_fn):
-                            src = photo_fn
-                        elif photo_fn:
-                            src = os.path.join(base, photo_fn)
-                    if src:
-                        circle_img = _crop_image_to_circle(src)
-                        if circle_img:
-                            marker = CustomMarker(lat=lat, lon=lon, source=circle_img)
-                        else:
-                            marker = MapMarker(lat=lat, lon=lon)
-                    else:
-                        marker = MapMarker(lat=lat, lon=lon)
-                    map_view.add_marker(marker)
-        map_container.add_widget(map_view)
-
-    screen.bind(on_enter=on_checkin_enter)
+    # One border group on the screen root instead of a canvas group per block
+    apply_debug_borders(
+        widget, (widget, title, places_block, checkins_block, map_container)
+    )
+
+    screen.fbind(
+        "on_enter",
+        partial(
+            _on_checkin_enter,
+            map_container,
+            loc_svc,
+            map_params,
+            places_block,
+            checkins_block,
+        ),
+    )
     return widget
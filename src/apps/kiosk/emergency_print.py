@@ -6,6 +6,7 @@ import re
 import subprocess
 import sys
 import tempfile
+import time
 
 from kivy.clock import Clock
 from kivy.metrics import dp
@@ -14,6 +15,9 @@ from .screen_primitives import KioskLabel, KioskButton
 
 logger = logging.getLogger(__name__)
 
+# A double tap on the touchscreen must not queue the document twice
+_PRINT_DEBOUNCE_S = 1.0
+
 
 def _parse_lp_job_id(stdout: str) -> str | None:
     """Parse 'request id is PrinterName-123 (1 file(s))' to get PrinterName-123."""
@@ -125,7 +129,13 @@ def add_emergency_print_section(layout, services):
     print_status = KioskLabel(type="caption", text="", size_hint_y=None, height=dp(36))
     services["_emergency_print_status_label"] = print_status
 
+    last_press = [float("-inf")]
+
     def _on_print(*_):
+        now = time.monotonic()
+        if now - last_press[0] < _PRINT_DEBOUNCE_S:
+            return
+        last_press[0] = now
         Clock.schedule_once(
             lambda dt: _run_emergency_print(emergency_svc, print_status), 0
         )
@@ -8,10 +8,16 @@ from kivy.uix.anchorlayout import AnchorLayout
 from kivy.graphics import Color, Line, Rectangle
 from kivy.clock import Clock
 
-from .screen_primitives import KioskLabel, KioskWidget, apply_debug_border
+from .screen_primitives import KioskLabel, KioskWidget, apply_debug_borders
 from .emergency_print import add_emergency_print_section
 
 
+def _sync_bar_bg(bar, value):
+    """Shared pos/size handler for every section bar (no per-bar closures)."""
+    bar._bg.pos = bar.pos
+    bar._bg.size = bar.size
+
+
 def _form_section_bar(title, bar_color=(1, 1, 1, 1), height=dp(44)):
     """Form-style section header: colored bar with white text."""
     bar = BoxLayout(
@@ -20,61 +26,101 @@ def _form_section_bar(title, bar_color=(1, 1, 1, 1), height=dp(44)):
     with bar.canvas.before:
         Color(*bar_color)
         bar._bg = Rectangle(pos=bar.pos, size=bar.size)
-    bar.bind(
-        pos=lambda w, v: setattr(w._bg, "pos", w.pos),
-        size=lambda w, v: setattr(w._bg, "size", w.size),
+    bar.fbind("pos", _sync_bar_bg)
+    bar.fbind("size", _sync_bar_bg)
+    bar.add_widget(
+        KioskLabel(type="header", text=title, font_size=dp(36), color=(1, 1, 1, 1))
     )
-    lbl = KioskLabel(type="header", text=title, font_size=dp(36))
-    lbl.color = (1, 1, 1, 1)
-    bar.add_widget(lbl)
     return bar
 
 
+def _join_present(*parts):
+    """Space-join the non-empty parts; empty parts are skipped rather than formatted and stripped."""
+    return " ".join(p for p in parts if p)
+
+
 def _form_row(label_text, value_text, dark_text=(0.1, 0.1, 0.1, 1)):
     """One labeled row: LABEL  value."""
     row = BoxLayout(
         orientation="horizontal", size_hint_y=None, height=dp(36), spacing=dp(8)
     )
-    lbl = KioskLabel(type="caption", text=label_text + ":", font_size=dp(28))
-    lbl.color = dark_text
-    lbl.size_hint_x = None
-    lbl.width = dp(220)
-    row.add_widget(lbl)
-    val = KioskLabel(type="body", text=value_text or "—", font_size=dp(28))
-    val.color = dark_text
-    row.add_widget(val)
+    # All label props go through the constructor: one pass, no post-init property dispatch
+    row.add_widget(
+        KioskLabel(
+            type="caption",
+            text=label_text + ":",
+            font_size=dp(28),
+            color=dark_text,
+            size_hint_x=None,
+            width=dp(220),
+        )
+    )
+    row.add_widget(
+        KioskLabel(
+            type="body", text=value_text or "—", font_size=dp(28), color=dark_text
+        )
+    )
     return row
 
 
-def _attach_emergency_border(widget, services):
-    """Draw an orange border on the widget; flash when alert is activated."""
-    alert_ref = services.get("_alert_activated", [False])
-    flash_state = [0]
+_BORDER_IDLE_COLOR = (0.9, 0.4, 0.1, 1)
+# Alert flash colors indexed by flash_state (0/1)
+_BORDER_ALERT_COLORS = ((1, 0.5, 0, 1), (1, 0.3, 0.1, 1))
+
 
-    def border_color():
-        if alert_ref[0]:
-            return (1, 0.3, 0.1, 1) if flash_state[0] else (1, 0.5, 0, 1)
-        return (0.9, 0.4, 0.1, 1)
+class _EmergencyBorder:
+    """Orange border on the emergency layout; flashes while an alert is active.
+    Clock and pos/size callbacks are bound methods on this object, not per-build closures."""
 
-    def redraw(*_):
-        widget.canvas.after.clear()
+    __slots__ = ("widget", "alert_ref", "flash_state", "flash_event", "color", "line")
+
+    def __init__(self, widget, alert_ref):
+        self.widget = widget
+        self.alert_ref = alert_ref
+        self.flash_state = 0
+        self.flash_event = None
+        # One Color/Line pair for the widget's lifetime: flashing swaps rgba, layout moves the rectangle
         with widget.canvas.after:
-            Color(*border_color())
-            Line(rectangle=(widget.x, widget.y, widget.width, widget.height), width=8)
+            self.color = Color(*self.border_color())
+            self.line = Line(
+                rectangle=(widget.x, widget.y, widget.width, widget.height), width=8
+            )
+        widget.fbind("pos", self.reposition)
+        widget.fbind("size", self.reposition)
+
+    def border_color(self):
+        if self.alert_ref[0]:
+            return _BORDER_ALERT_COLORS[self.flash_state]
+        return _BORDER_IDLE_COLOR
+
+    def reposition(self, widget, value):
+        self.line.rectangle = (widget.x, widget.y, widget.width, widget.height)
+
+    def tick(self, dt):
+        self.flash_state = 1 - self.flash_state
+        self.color.rgba = self.border_color()
+
+    def set_flashing(self, active):
+        """Run the 2 Hz flash only while alerted; the idle border only follows pos/size."""
+        if active and self.flash_event is None:
+            self.flash_event = Clock.schedule_interval(self.tick, 0.5)
+        elif not active and self.flash_event is not None:
+            self.flash_event.cancel()
+            self.flash_event = None
+            self.flash_state = 0
+        self.color.rgba = self.border_color()
 
-    def tick(dt):
-        flash_state[0] = 1 - flash_state[0]
-        redraw()
 
-    widget.bind(pos=redraw, size=redraw)
-    Clock.schedule_interval(tick, 0.5)
-    redraw()
+def _attach_emergency_border(widget, services):
+    """Draw an orange border on the widget; flash when alert is activated."""
+    border = _EmergencyBorder(widget, services.get("_alert_activated", [False]))
+    services["_emergency_border_flash"] = border.set_flashing
+    border.set_flashing(border.alert_ref[0])
 
 
 def _build_layout(layout, e_data, e_contacts, services):
     """Build the emergency layout (form-style sections). Returns the root KioskWidget."""
     blue_bar = _form_section_bar("IN CASE OF EMERGENCY", (0.25, 0.45, 0.85, 1))
-    apply_debug_border(blue_bar)
     layout.add_widget(blue_bar)
 
     patient_data = e_data.get("profile") or {}
@@ -92,38 +138,46 @@ def _build_layout(layout, e_data, e_contacts, services):
     personal.add_widget(
         _form_section_bar("PERSONAL INFORMATION", red_bar, height=dp(40))
     )
-    name = patient_data.get("name") or "Patient"
-    personal.add_widget(_form_row("FULL NAME", name))
-    personal.add_widget(_form_row("DOB", patient_data.get("dob")))
     dnr = medical_data.get("dnr", False)
-    personal.add_widget(_form_row("CODE STATUS", "DNR" if dnr else "FULL CODE"))
     allergies = medical_data.get("allergies") or []
-    personal.add_widget(
-        _form_row("ALLERGIES", ", ".join(allergies) if allergies else None)
-    )
-    meds = medical_data.get("medications") or []
     med_strs = []
-    for m in meds:
-        n = m.get("name") or ""
+    for m in medical_data.get("medications") or []:
         dosage = (m.get("dosage") or "").strip()
         freq = (m.get("frequency") or "").strip()
-        if dosage or freq:
-            n += " " + " ".join([dosage, freq]).strip()
-        med_strs.append(n)
-    personal.add_widget(
-        _form_row("MEDICATIONS", ", ".join(med_strs) if med_strs else None)
+        med_strs.append(_join_present(m.get("name"), dosage, freq))
+    personal_rows = (
+        ("FULL NAME", patient_data.get("name") or "Patient"),
+        ("DOB", patient_data.get("dob")),
+        ("CODE STATUS", "DNR" if dnr else "FULL CODE"),
+        ("ALLERGIES", ", ".join(allergies) if allergies else None),
+        ("MEDICATIONS", ", ".join(med_strs) if med_strs else None),
+        ("CURRENT HEALTH CONDITIONS", medical_data.get("conditions")),
+    )
+    for label_text, value_text in personal_rows:
+        personal.add_widget(_form_row(label_text, value_text))
+
+    # Contact rows formatted in one pass; proxy and POA rows follow
+    contact_rows = [
+        (
+            f"CONTACT {i}",
+            f"{c.get('display_name', '')} ({c.get('relationship') or ''}): "
+            f"{c.get('phone') or ''}".strip(),
+        )
+        for i, c in enumerate(e_contacts.get("contacts", []), 1)
+    ]
+    contact_rows.append(
+        (
+            "MEDICAL PROXY",
+            _join_present(
+                e_contacts.get("medical_proxy_name"),
+                e_contacts.get("medical_proxy_phone"),
+            ),
+        )
+    )
+    contact_rows.append(
+        ("POA", _join_present(e_contacts.get("poa_name"), e_contacts.get("poa_phone")))
     )
-    cond = medical_data.get("conditions")
-    personal.add_widget(_form_row("CURRENT HEALTH CONDITIONS", cond))
-    apply_debug_border(personal)
-
-    ec_list = []
-    for c in e_contacts.get("contacts", []):
-        phone = c.get("phone") or ""
-        rel = c.get("relationship") or ""
-        ec_list.append(f"{c.get('display_name', '')} ({rel}): {phone}".strip())
-    n_contact_rows = len(ec_list) + 2
-    contacts_height = dp(40) + n_contact_rows * dp(40)
+    contacts_height = dp(40) + len(contact_rows) * dp(40)
 
     contacts_section = BoxLayout(
         orientation="vertical",
@@ -136,19 +190,8 @@ def _build_layout(layout, e_data, e_contacts, services):
         _form_section_bar("EMERGENCY CONTACTS", red_bar, height=dp(40))
     )
 
-    for i, line in enumerate(ec_list):
-        contacts_section.add_widget(_form_row("CONTACT " + str(i + 1), line))
-
-    proxy_name = e_contacts.get("medical_proxy_name") or ""
-    proxy_phone = e_contacts.get("medical_proxy_phone") or ""
-    contacts_section.add_widget(
-        _form_row("MEDICAL PROXY", f"{proxy_name} {proxy_phone}".strip())
-    )
-
-    poa_name = e_contacts.get("poa_name") or ""
-    poa_phone = e_contacts.get("poa_phone") or ""
-    contacts_section.add_widget(_form_row("POA", f"{poa_name} {poa_phone}".strip()))
-    apply_debug_border(contacts_section)
+    for label_text, value_text in contact_rows:
+        contacts_section.add_widget(_form_row(label_text, value_text))
 
     bottom_box = BoxLayout(
         orientation="vertical",
@@ -157,18 +200,21 @@ def _build_layout(layout, e_data, e_contacts, services):
     )
     top_half = AnchorLayout(anchor_y="center", size_hint_y=0.5)
     top_half.add_widget(personal)
-    apply_debug_border(top_half)
     bottom_box.add_widget(top_half)
 
     bottom_half = AnchorLayout(anchor_y="center", size_hint_y=0.5)
     bottom_half.add_widget(contacts_section)
-    apply_debug_border(bottom_half)
     bottom_box.add_widget(bottom_half)
 
     layout.add_widget(bottom_box)
 
     add_emergency_print_section(layout, services)
 
+    # One border group on the layout instead of a canvas group per section
+    apply_debug_borders(
+        layout, (blue_bar, personal, contacts_section, top_half, bottom_half)
+    )
+
     _attach_emergency_border(layout, services)
     return layout
 
@@ -2,7 +2,12 @@
 Home screen: clock, medications, events.
 """
 
-from .screen_primitives import KioskWidget, KioskLabel, KioskButton, apply_debug_border
+from .screen_primitives import (
+    KioskWidget,
+    KioskLabel,
+    KioskButton,
+    apply_debug_borders,
+)
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image
 from kivy.uix.anchorlayout import AnchorLayout
@@ -11,21 +16,41 @@ import os
 
 logger = logging.getLogger(__name__)
 
+# Widget-specific tokens (clock, med, events)
+CLOCK_ICON_SIZE = 100
+CLOCK_DAY_HEIGHT = 60
+CLOCK_TEXT_HEIGHT = 50
+CLOCK_TIME_HEIGHT = 120
+CLOCK_DATE_HEIGHT = 60
+CLOCK_SPACING = 0
+CLOCK_PADDING = (15, 10)
+CLOCK_TEXT_COLOR = (0.1, 0.1, 0.1, 1)
+MEDICATION_BG = (0.94, 0.96, 0.98, 1)
+EVENTS_BG = (0.96, 0.98, 0.94, 1)
+
+
+_KIOSK_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _icon_path(filename):
+    """Absolute path of an icon under icons/, or "" if the file is missing."""
+    path = os.path.join(_KIOSK_DIR, "icons", filename)
+    return path if os.path.exists(path) else ""
+
+
+# Resolved and existence-checked once at import; lookups never touch the filesystem
+_TIME_OF_DAY_ICONS = {
+    "Morning": _icon_path("sunrise.png"),
+    "Noon": _icon_path("noon.png"),
+    "Afternoon": _icon_path("noon.png"),
+    "Evening": _icon_path("evening.png"),
+    "Night": _icon_path("night.png"),
+}
+
 
 def get_time_of_day_icon(time_of_day):
     """Get the appropriate icon for the time of day. Returns empty string if file not found."""
-    _kiosk_dir = os.path.dirname(os.path.abspath(__file__))
-    icon_map = {
-        "Morning": os.path.join(_kiosk_dir, "icons", "sunrise.png"),
-        "Noon": os.path.join(_kiosk_dir, "icons", "noon.png"),
-        "Afternoon": os.path.join(_kiosk_dir, "icons", "noon.png"),
-        "Evening": os.path.join(_kiosk_dir, "icons", "evening.png"),
-        "Night": os.path.join(_kiosk_dir, "icons", "night.png"),
-    }
-    path = icon_map.get(time_of_day)
-    if path and os.path.exists(path):
-        return path
-    return ""
+    return _TIME_OF_DAY_ICONS.get(time_of_day, "")
 
 
 def build_home_screen(services):
@@ -54,94 +79,89 @@ def build_home_screen(services):
     return content, clock_widget, med_widget, events_widget
 
 
+def _clock_label(type, **props):
+    """Clock label; all props go through the constructor in one pass."""
+    return KioskLabel(type=type, text="", color=CLOCK_TEXT_COLOR, **props)
+
+
 def _create_clock_widget(services):
-    # Widget-specific tokens (clock, med, events)
-    CLOCK_ICON_SIZE = 100
-    CLOCK_DAY_HEIGHT = 60
-    CLOCK_TEXT_HEIGHT = 50
-    CLOCK_TIME_HEIGHT = 120
-    CLOCK_DATE_HEIGHT = 60
-    CLOCK_SPACING = 0
-    CLOCK_PADDING = [15, 10]
-    text_color = (0.1, 0.1, 0.1, 1)
-
-    clock = KioskWidget()
-    clock.spacing = CLOCK_SPACING
-    clock.padding = CLOCK_PADDING
-    apply_debug_border(clock)
-
-    top_section = BoxLayout(orientation="horizontal")
-    top_section.size_hint = (1, None)
-    top_section.height = CLOCK_DAY_HEIGHT + CLOCK_TEXT_HEIGHT
-    apply_debug_border(top_section)
-
-    left_stack = BoxLayout(orientation="vertical")
-    left_stack.size_hint = (0.7, 1)
-
-    day_label = KioskLabel(type="header", text="")
-    day_label.color = text_color
-    day_label.size_hint = (1, 0.5)
-    apply_debug_border(day_label)
+    clock = KioskWidget(spacing=CLOCK_SPACING, padding=CLOCK_PADDING)
+
+    top_section = BoxLayout(
+        orientation="horizontal",
+        size_hint=(1, None),
+        height=CLOCK_DAY_HEIGHT + CLOCK_TEXT_HEIGHT,
+    )
+
+    left_stack = BoxLayout(orientation="vertical", size_hint=(0.7, 1))
+
+    day_label = _clock_label("header", size_hint=(1, 0.5))
     left_stack.add_widget(day_label)
 
-    time_of_day_label = KioskLabel(type="subheader", text="")
-    time_of_day_label.color = text_color
-    time_of_day_label.halign = "left"
-    time_of_day_label.valign = "top"
-    time_of_day_label.size_hint = (1, 0.5)
-    apply_debug_border(time_of_day_label)
+    time_of_day_label = _clock_label(
+        "subheader", halign="left", valign="top", size_hint=(1, 0.5)
+    )
     left_stack.add_widget(time_of_day_label)
 
     top_section.add_widget(left_stack)
 
-    icon_container = AnchorLayout(anchor_x="center", anchor_y="center")
-    icon_container.size_hint = (0.3, 1)
-    apply_debug_border(icon_container)
+    icon_container = AnchorLayout(
+        anchor_x="center", anchor_y="center", size_hint=(0.3, 1)
+    )
 
-    time_of_day_icon = Image()
-    time_of_day_icon.size_hint = (None, None)
-    time_of_day_icon.width = CLOCK_ICON_SIZE
-    time_of_day_icon.height = CLOCK_ICON_SIZE
     time_svc = services.get("time_service")
     initial_time_of_day = time_svc.get_am_pm() if time_svc else "Morning"
-    time_of_day_icon.source = get_time_of_day_icon(initial_time_of_day)
+    time_of_day_icon = Image(
+        size_hint=(None, None),
+        size=(CLOCK_ICON_SIZE, CLOCK_ICON_SIZE),
+        source=get_time_of_day_icon(initial_time_of_day),
+    )
     icon_container.add_widget(time_of_day_icon)
 
     top_section.add_widget(icon_container)
     clock.add_widget(top_section)
 
-    time_label = KioskLabel(type="hero", text="")
-    time_label.color = text_color
-    time_label.halign = "center"
-    time_label.valign = "middle"
-    time_label.size_hint = (1, None)
-    time_label.height = CLOCK_TIME_HEIGHT
-    apply_debug_border(time_label)
+    time_label = _clock_label(
+        "hero",
+        halign="center",
+        valign="middle",
+        size_hint=(1, None),
+        height=CLOCK_TIME_HEIGHT,
+    )
     clock.add_widget(time_label)
 
-    bottom_section = BoxLayout(orientation="horizontal")
-    bottom_section.size_hint = (1, None)
-    bottom_section.height = CLOCK_DATE_HEIGHT
-    apply_debug_border(bottom_section)
-
-    date_label = KioskLabel(type="subheader", text="")
-    date_label.color = text_color
-    date_label.halign = "left"
-    date_label.valign = "middle"
-    date_label.size_hint = (0.6, 1)
-    apply_debug_border(date_label)
+    bottom_section = BoxLayout(
+        orientation="horizontal", size_hint=(1, None), height=CLOCK_DATE_HEIGHT
+    )
+
+    date_label = _clock_label(
+        "subheader", halign="left", valign="middle", size_hint=(0.6, 1)
+    )
     bottom_section.add_widget(date_label)
 
-    year_label = KioskLabel(type="subheader", text="")
-    year_label.color = text_color
-    year_label.halign = "right"
-    year_label.valign = "middle"
-    year_label.size_hint = (0.4, 1)
-    apply_debug_border(year_label)
+    year_label = _clock_label(
+        "subheader", halign="right", valign="middle", size_hint=(0.4, 1)
+    )
     bottom_section.add_widget(year_label)
 
     clock.add_widget(bottom_section)
 
+    # One border group on the clock instead of a canvas group per sub-widget
+    apply_debug_borders(
+        clock,
+        (
+            clock,
+            top_section,
+            day_label,
+            time_of_day_label,
+            icon_container,
+            time_label,
+            bottom_section,
+            date_label,
+            year_label,
+        ),
+    )
+
     clock.day_label = day_label
     clock.time_of_day_icon = time_of_day_icon
     clock.time_of_day_label = time_of_day_label
@@ -153,8 +173,7 @@ def _create_clock_widget(services):
 
 
 def _create_medication_widget():
-    light_blue = (0.94, 0.96, 0.98, 1)
-    med = KioskWidget(background_color=light_blue)
+    med = KioskWidget(background_color=MEDICATION_BG)
 
     title = KioskLabel(type="header", text="Medications")
     med.add_widget(title)
@@ -195,7 +214,6 @@ def _create_medication_widget():
 
 
 def _create_events_widget():
-    EVENTS_BG = (0.96, 0.98, 0.94, 1)
     events = KioskWidget(orientation="vertical", background_color=EVENTS_BG)
 
     title = KioskLabel(type="header", text="Today's Events")
@@ -206,9 +224,7 @@ def _create_events_widget():
     events.events_content = events_content
 
     def update(data):
-        events_content.text = (
-            "\n".join(f"• {e}" for e in data) if data else "No events today"
-        )
+        events_content.text = "• " + "\n• ".join(data) if data else "No events today"
 
     events.update = update
     return events
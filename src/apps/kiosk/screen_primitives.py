@@ -1,31 +1,40 @@
 """
 Kiosk UI primitives: base styled components.
-KioskWidget, KioskLabel, KioskButton, apply_debug_border.
+KioskWidget, KioskLabel, KioskButton, apply_debug_border(s).
 Design tokens live here; composites in widgets.py.
 """
 
-from kivy.graphics import Color, Line, Rectangle
+from collections.abc import Mapping
+
+from kivy.clock import Clock
+from kivy.graphics import Color, InstructionGroup, Line, Rectangle
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 
+from shared.config import get_debug_borders
+
 
 class KioskWidget(BoxLayout):
     """Base widget with dementia-friendly defaults."""
 
+    _DEFAULTS = {
+        "size_hint": (1, 1),
+        "padding": 16,
+        "spacing": 16,
+        "orientation": "vertical",
+    }
+
     def __init__(self, background_color=None, **kwargs):
-        defaults = {
-            "size_hint": (1, 1),
-            "padding": 16,
-            "spacing": 16,
-            "orientation": "vertical",
-        }
+        # Named explicitly: subclasses (KioskNavBar) define their own _DEFAULTS layered on top
+        defaults = dict(KioskWidget._DEFAULTS)
         defaults.update(kwargs)
         background_color = defaults.pop("background_color", background_color)
         BoxLayout.__init__(self, **defaults)
 
         self._setup_background(background_color)
-        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.fbind("pos", self._update_bg)
+        self.fbind("size", self._update_bg)
 
     def _setup_background(self, custom_color=None):
         """Setup background with dementia-friendly colors."""
@@ -42,27 +51,61 @@ class KioskWidget(BoxLayout):
         self.bg_rect.size = self.size
 
 
-def apply_debug_border(widget, **kwargs):
-    """Apply default border to widget."""
-    b = {"color": [0, 0, 0, 1], "width": 1}
-    b.update(kwargs)
+_DEBUG_BORDER = {"color": (0, 0, 0, 1), "width": 1}
+# Read once at import: with borders off, apply_debug_border(s) adds no canvas work or bindings
+_DEBUG_BORDERS_ENABLED = get_debug_borders()
+
+# (border, widget) pairs whose pos/size changed since the last flush
+_dirty_borders = []
 
-    def make_updater(color, width):
-        def update(instance, value):
-            instance.canvas.after.clear()
-            with instance.canvas.after:
-                Color(*color)
-                Line(
-                    rectangle=(instance.x, instance.y, instance.width, instance.height),
-                    width=width,
-                )
 
-        return update
+def _flush_border_lines(dt):
+    """Move every border whose widget changed this frame, once, to its final rect."""
+    pending = _dirty_borders[:]
+    _dirty_borders.clear()
+    for border, widget in pending:
+        border[2] = False
+        rect = (widget.x, widget.y, widget.width, widget.height)
+        if rect != border[1]:
+            border[1] = rect
+            border[0].rectangle = rect
 
-    widget.bind(
-        pos=make_updater(b["color"], b["width"]),
-        size=make_updater(b["color"], b["width"]),
-    )
+
+_flush_borders_trigger = Clock.create_trigger(_flush_border_lines, 0)
+
+
+def _move_border_line(border, instance, value):
+    """Shared pos/size handler; border is [line, last_rect, dirty]. Queues one update per frame."""
+    if border[2]:
+        return
+    border[2] = True
+    _dirty_borders.append((border, instance))
+    _flush_borders_trigger()
+
+
+def apply_debug_borders(parent, widgets, **kwargs):
+    """Apply default border to several widgets from one InstructionGroup on parent.canvas.after.
+    One Color for the group, one Line per widget; each widget's pos/size only moves its own Line,
+    coalesced so a layout pass that changes both pos and size moves it once.
+    No-op unless DEBUG_BORDERS=1."""
+    if not _DEBUG_BORDERS_ENABLED:
+        return
+    b = dict(_DEBUG_BORDER, **kwargs) if kwargs else _DEBUG_BORDER
+    group = InstructionGroup()
+    group.add(Color(*b["color"]))
+    for widget in widgets:
+        rect = (widget.x, widget.y, widget.width, widget.height)
+        line = Line(rectangle=rect, width=b["width"])
+        group.add(line)
+        border = [line, rect, False]
+        widget.fbind("pos", _move_border_line, border)
+        widget.fbind("size", _move_border_line, border)
+    parent.canvas.after.add(group)
+
+
+def apply_debug_border(widget, **kwargs):
+    """Apply default border to widget."""
+    apply_debug_borders(widget, (widget,), **kwargs)
 
 
 class KioskLabel(Label):
@@ -109,22 +152,24 @@ class KioskLabel(Label):
         def _update_text_size(widget, *args):
             widget.text_size = widget.size
 
-        self.bind(size=_update_text_size)
+        self.fbind("size", _update_text_size)
         _update_text_size(self)
 
 
 class KioskButton(Button):
     """Button with hardcoded standard style. Override via kwargs."""
 
+    _DEFAULTS = {
+        "font_size": 56,
+        "color": (0.1, 0.1, 0.1, 1),
+        "background_color": (0.4, 0.6, 0.85, 1),
+        "background_normal": "",
+        "background_down": "",
+        "size_hint": (1, 1),
+    }
+
     def __init__(self, **kwargs):
-        defaults = {
-            "font_size": 56,
-            "color": (0.1, 0.1, 0.1, 1),
-            "background_color": (0.4, 0.6, 0.85, 1),
-            "background_normal": "",
-            "background_down": "",
-            "size_hint": (1, 1),
-        }
+        defaults = dict(KioskButton._DEFAULTS)
         defaults.update(kwargs)
         Button.__init__(self, **defaults)
 
@@ -132,16 +177,18 @@ class KioskButton(Button):
 class KioskNavBar(KioskWidget):
     """Generic navigation bar with configurable buttons."""
 
+    _DEFAULTS = {
+        "orientation": "horizontal",
+        "size_hint": (1, None),
+        "height": 90,
+    }
+
     def __init__(self, screen_manager=None, buttons=None, **kwargs):
-        defaults = {
-            "orientation": "horizontal",
-            "size_hint": (1, None),
-            "height": 90,
-        }
+        defaults = dict(KioskNavBar._DEFAULTS)
         defaults.update(kwargs)
         super().__init__(**defaults)
         self.screen_manager = screen_manager
-        self.buttons = buttons or []
+        self.buttons = buttons or ()
 
         # Create navigation buttons
         self._create_nav_buttons()
@@ -152,36 +199,35 @@ class KioskNavBar(KioskWidget):
             print("WARNING: No nav buttons configured!")
             return
 
-        nav_button_width = 1.0 / len(self.buttons)
+        # Shared by every button: one size_hint tuple and one bound press handler
+        size_hint = (1.0 / len(self.buttons), None)
+        height = self.height
+        on_nav_press = self._on_nav_press
 
         for button_config in self.buttons:
-            if isinstance(button_config, dict):
+            if isinstance(button_config, Mapping):
                 text = button_config["text"]
                 screen_name = button_config["screen"]
             else:
                 continue
 
-            btn = KioskButton(
-                text=text,
-                size_hint=(nav_button_width, None),
-                height=self.height,
-            )
-
-            # Create proper closures for all callbacks to avoid reference issues
-            def make_press_handler(btn_text, btn_screen):
-                def press_handler(instance):
-                    # print(f"on_press FIRED for button '{btn_text}' -> screen '{btn_screen}'")
-                    self._navigate_to_screen(btn_screen)
-
-                return press_handler
-
-            btn.bind(on_press=make_press_handler(text, screen_name))
+            btn = KioskButton(text=text, size_hint=size_hint, height=height)
+            # Target screen lives on the button; one bound handler serves every button
+            btn.screen_name = screen_name
+            btn.fbind("on_press", on_nav_press)
             self.add_widget(btn)
 
+    def _on_nav_press(self, instance):
+        """Nav button on_press: go to the button's screen."""
+        self._navigate_to_screen(instance.screen_name)
+
     def _navigate_to_screen(self, screen_name):
         """Navigate to specified screen."""
         if self.screen_manager:
-            self.screen_manager.current = screen_name
+            # Screens other than the first are built over the first few frames after boot;
+            # a tap on one that is not built yet is ignored rather than raising
+            if self.screen_manager.has_screen(screen_name):
+                self.screen_manager.current = screen_name
         else:
             print(
                 f"ERROR: Cannot navigate to '{screen_name}' - screen_manager is None!"
@@ -1,17 +1,47 @@
 """
 Screen creation logic for Meridian Kiosk.
-Thin registry: each create_x_screen follows the same 4-line pattern.
+Thin registry: each create_x_screen delegates to _make_screen with its content builder.
 """
 
-from kivy.uix.boxlayout import BoxLayout
+from types import MappingProxyType
+
+from kivy.factory import Factory
+from kivy.lang import Builder
 from kivy.uix.screenmanager import Screen
 
 from .screen_primitives import KioskNavBar
 
+# Shared outer layout for every screen; rule is parsed once at import and applied per instance
+Builder.load_string(
+    """
+<ScreenTemplateLayout@BoxLayout>:
+    orientation: "vertical"
+    size_hint: 1, 1
+    padding: 24
+    spacing: 24
+"""
+)
+
+# Read-only nav config shared by every screen's nav bar
+NAV_BUTTONS = (
+    MappingProxyType({"text": "Home", "screen": "home"}),
+    MappingProxyType({"text": "Emergency", "screen": "emergency"}),
+    MappingProxyType({"text": "Family", "screen": "family"}),
+    MappingProxyType({"text": "Chat", "screen": "chat"}),
+)
+
 
 class ScreenFactory:
     """Factory for creating kiosk screens."""
 
+    __slots__ = (
+        "services",
+        "screen_manager",
+        "kiosk_user_id",
+        "family_circle_id",
+        "nav_buttons",
+    )
+
     def __init__(
         self, services, screen_manager, kiosk_user_id: str, family_circle_id: str
     ):
@@ -19,91 +49,71 @@ class ScreenFactory:
         self.screen_manager = screen_manager
         self.kiosk_user_id = kiosk_user_id
         self.family_circle_id = family_circle_id
+        # Nav config is the same for every screen: filter once, not per nav bar
+        nav_buttons = NAV_BUTTONS
+        if not services.get("chat_entry_service"):
+            nav_buttons = tuple(b for b in nav_buttons if b["screen"] != "chat")
+        self.nav_buttons = nav_buttons
 
     def screen_template_boxlayout(self):
-        template_settings = {
-            "orientation": "vertical",
-            "size_hint": (1, 1),
-            "padding": 24,
-            "spacing": 24,
-        }
-
-        main_layout = BoxLayout(**template_settings)
+        main_layout = Factory.ScreenTemplateLayout()
         nav_widget = self._create_navigation()
         main_layout.add_widget(nav_widget)
 
         return main_layout
 
+    def _make_screen(self, name, build_content):
+        """Shared pattern: Screen -> template layout (nav) -> build_content(screen), filling the rest."""
+        screen = Screen(name=name)
+        main_layout = self.screen_template_boxlayout()
+
+        content = build_content(screen)
+        content.size_hint = (1, 1)
+        main_layout.add_widget(content)
+
+        screen.add_widget(main_layout)
+        return screen
+
     def create_home_screen(self):
         """Create home screen: clock, medications, events."""
         from .home_screen import build_home_screen
 
-        screen = Screen(name="home")
-        main_layout = self.screen_template_boxlayout()
-
         content, clock_widget, med_widget, events_widget = build_home_screen(
             self.services
         )
-        content.size_hint = (1, 1)
-        main_layout.add_widget(content)
-
-        screen.add_widget(main_layout)
+        screen = self._make_screen("home", lambda _screen: content)
         return screen, clock_widget, med_widget, events_widget
 
     def create_emergency_screen(self):
         """Create emergency screen: critical patient info for EMS."""
         from .emergency_screen import build_emergency_screen
 
-        screen = Screen(name="emergency")
-        main_layout = self.screen_template_boxlayout()
-
-        emergency_profile = build_emergency_screen(self.services)
-        emergency_profile.size_hint = (1, 1)
-        main_layout.add_widget(emergency_profile)
-
-        screen.add_widget(main_layout)
-        return screen
+        return self._make_screen(
+            "emergency", lambda _screen: build_emergency_screen(self.services)
+        )
 
     def create_checkin_screen(self):
         """Create family location check-in screen."""
         from .checkin_screen import build_checkin_screen
 
-        screen = Screen(name="family")
-        main_layout = self.screen_template_boxlayout()
-
-        family_widget = build_checkin_screen(self.services, screen)
-        family_widget.size_hint = (1, 1)
-        main_layout.add_widget(family_widget)
-
-        screen.add_widget(main_layout)
-        return screen
+        return self._make_screen(
+            "family", lambda screen: build_checkin_screen(self.services, screen)
+        )
 
     def create_chat_screen(self):
         """Create chat screen: contact grid with chat entry."""
         from .chat_screen import build_chat_screen
 
-        screen = Screen(name="chat")
-        main_layout = self.screen_template_boxlayout()
-
-        content = build_chat_screen(
-            self.services, self.kiosk_user_id, self.family_circle_id, screen
+        return self._make_screen(
+            "chat",
+            lambda screen: build_chat_screen(
+                self.services, self.kiosk_user_id, self.family_circle_id, screen
+            ),
         )
-        main_layout.add_widget(content)
-        screen.add_widget(main_layout)
-
-        return screen
 
     def _create_navigation(self):
         """Create navigation bar using modular components."""
-        nav_buttons = [
-            {"text": "Home", "screen": "home"},
-            {"text": "Emergency", "screen": "emergency"},
-            {"text": "Family", "screen": "family"},
-            {"text": "Chat", "screen": "chat"},
-        ]
-        if not self.services.get("chat_entry_service"):
-            nav_buttons = [b for b in nav_buttons if b["screen"] != "chat"]
         return KioskNavBar(
             screen_manager=self.screen_manager,
-            buttons=nav_buttons,
+            buttons=self.nav_buttons,
         )
@@ -6,14 +6,16 @@ import sys
 
 def main():
     from ...shared.config import (
+        DatabaseConfig,
         get_server_host,
         get_server_port,
         get_database_path,
         find_available_port,
     )
 
-    if len(sys.argv) > 1 and sys.argv[1].lower() == "seed":
-        from ...shared.config import DatabaseConfig
+    arg = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if arg is not None and arg.lower() == "seed":
         from ...dev.demo.seed import demo_main
         from .database import DatabaseManager
 
@@ -29,9 +31,9 @@ def main():
 
     host = get_server_host()
     start_port = get_server_port()
-    if len(sys.argv) > 1:
+    if arg is not None:
         try:
-            start_port = int(sys.argv[1])
+            start_port = int(arg)
         except ValueError:
             pass
     port = find_available_port(host, start_port)
@@ -41,7 +43,8 @@ def main():
 
     from .api import run_server
 
-    run_server()
+    # Host and port are already resolved: pass them instead of re-reading the environment
+    run_server(host=host, port=port)
 
 
 if __name__ == "__main__":
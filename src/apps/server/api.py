@@ -22,14 +22,15 @@ import hashlib
 import hmac
 import json
 import os
+import re
+import threading
 import time
 import datetime
 import urllib.parse
-from dataclasses import asdict
+from collections import OrderedDict
 from flask import (
     Flask,
     abort,
-    jsonify,
     request,
     g,
     send_from_directory,
@@ -37,6 +38,12 @@ from flask import (
     redirect,
     session,
 )
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # config from shared; server internals relative
 try:
@@ -65,9 +72,64 @@ except ImportError:
     from shared.config import get_uploads_dir
 
 _alert_activated = False
+# Alert status is polled by every TV: both possible bodies are encoded once
+_ALERT_BODIES = {
+    False: b'{"data":{"activated":false}}',
+    True: b'{"data":{"activated":true}}',
+}
 
 _ENTRY_TOKEN_TTL_SEC = 300  # 5 minutes
 
+_JSON_MIMETYPE = "application/json"
+
+# ?date= as Y-M-D; month/day may omit the leading zero, as strptime("%Y-%m-%d") allowed
+_DATE_PARAM = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})")
+
+# Public bundled assets (login page, app.js, chatapp): browsers reuse them for this long,
+# then revalidate with the ETag send_from_directory already sets (304 when unchanged)
+_STATIC_MAX_AGE_SEC = 300
+
+# Request paths handled specially by set_user_id (no auth / session-only)
+_OPEN_PATHS = frozenset(("/api/health", "/api/login", "/api/logout", "/auth"))
+_PUBLIC_STATIC_PATHS = frozenset(("/login.html", "/app.js"))
+_WEBAPP_PAGE_PATHS = frozenset(("/", "/index.html"))
+_CHECKIN_PATHS = frozenset(("/checkin", "/checkin.js"))
+
+# Calendar GET responses are cached as serialized bodies per full path (incl. ?date=).
+# Headers/month/date are pure functions of the date; events come from the DB, so short TTL.
+_CALENDAR_CACHE_MAX = 256
+_CALENDAR_TTL_SEC = 60.0
+_CALENDAR_EVENTS_TTL_SEC = 5.0
+
+# Emergency profile GET body per family; written through this server's PUT, so the TTL
+# only bounds staleness after edits made directly in the DB (seed, admin)
+_EMERGENCY_PROFILE_TTL_SEC = 60.0
+
+
+class _OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson when installed; falls back to the stdlib provider.
+    Dates still go through Flask's default(), so parsed JSON is unchanged; bodies carry
+    non-ASCII text as raw UTF-8 instead of \\uXXXX escapes."""
+
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.get("indent")
+        unsupported = kwargs.keys() - {"indent", "separators"}
+        if orjson is None or unsupported or indent not in (None, 2):
+            if indent is None:
+                kwargs.setdefault("separators", (",", ":"))
+            return super().dumps(obj, **kwargs)
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
 
 def _create_chat_entry_token(
     secret: str,
@@ -122,6 +184,21 @@ def create_server_app(db_path=None):
     container = create_service_container(db_path)
 
     app = Flask(__name__)
+    app.json = _OrjsonProvider(app)
+
+    def _json(obj, status=200):
+        """JSON response, serialized by app.json directly (no jsonify)."""
+        return app.response_class(
+            app.json.dumps(obj), status=status, mimetype=_JSON_MIMETYPE
+        )
+
+    def _ok(data, status=200):
+        """{"data": ...} JSON response."""
+        return _json({"data": data}, status)
+
+    def _err(message, status):
+        """{"error": message} JSON response with the given status code."""
+        return _json({"error": message}, status)
     _secret = os.environ.get("SECRET_KEY")
     if not _secret:
         import logging
@@ -138,26 +215,28 @@ def create_server_app(db_path=None):
         sid = session.get("_sid")
         return sid and sid == app.config.get("SESSION_SERVER_ID")
 
+    # CORS_ORIGIN is fixed for the process: parse it and build the static headers once
+    _cors_origins = [
+        o.strip()
+        for o in (os.environ.get("CORS_ORIGIN") or "").split(",")
+        if o.strip()
+    ]
+    _cors_allowed = frozenset(_cors_origins)
+    _cors_headers = {
+        "Access-Control-Allow-Origin": _cors_origins[0] if _cors_origins else "*",
+        "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+        "Access-Control-Allow-Headers": "Content-Type, X-User-Id, X-Family-Circle-Id",
+    }
+    if _cors_origins:
+        _cors_headers["Access-Control-Allow-Credentials"] = "true"
+
     @app.after_request
     def add_cors(resp):
-        origins = [
-            o.strip()
-            for o in (os.environ.get("CORS_ORIGIN") or "").split(",")
-            if o.strip()
-        ]
-        req_origin = request.headers.get("Origin", "").strip()
-        if origins and req_origin and req_origin in origins:
-            resp.headers["Access-Control-Allow-Origin"] = req_origin
-            resp.headers["Access-Control-Allow-Credentials"] = "true"
-        elif origins:
-            resp.headers["Access-Control-Allow-Origin"] = origins[0]
-            resp.headers["Access-Control-Allow-Credentials"] = "true"
-        else:
-            resp.headers["Access-Control-Allow-Origin"] = "*"
-        resp.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-        resp.headers["Access-Control-Allow-Headers"] = (
-            "Content-Type, X-User-Id, X-Family-Circle-Id"
-        )
+        resp.headers.update(_cors_headers)
+        if _cors_allowed:
+            req_origin = request.headers.get("Origin", "").strip()
+            if req_origin in _cors_allowed:
+                resp.headers["Access-Control-Allow-Origin"] = req_origin
         return resp
 
     @app.after_request
@@ -173,17 +252,17 @@ def create_server_app(db_path=None):
     @app.before_request
     def set_user_id():
         """Resolve user_id and family_circle_id from headers or session. Fail if missing."""
-        if request.path in ("/api/health", "/api/login", "/api/logout", "/auth"):
+        if request.path in _OPEN_PATHS:
             g.user_id = None
             g.family_circle_id = None
             return
         # Public routes: no auth required (login page, chatapp POC)
-        if request.path in ("/login.html", "/app.js") or request.path.startswith("/chatapp/"):
+        if request.path in _PUBLIC_STATIC_PATHS or request.path.startswith("/chatapp/"):
             g.user_id = None
             g.family_circle_id = None
             return
         # / and /index.html: require session, redirect to login if missing
-        if request.path in ("/", "/index.html"):
+        if request.path in _WEBAPP_PAGE_PATHS:
             if not _session_valid():
                 session.clear()
                 return redirect("/login.html")
@@ -195,7 +274,7 @@ def create_server_app(db_path=None):
             g.family_circle_id = fid
             return
         # /checkin, /checkin.js: session-only; route handles redirect/401
-        if request.path in ("/checkin", "/checkin.js"):
+        if request.path in _CHECKIN_PATHS:
             if not _session_valid():
                 session.clear()
                 g.user_id = None
@@ -285,25 +364,20 @@ def create_server_app(db_path=None):
         )
         base_url = request.url_root.rstrip("/")
         bootstrap_url = f"{base_url}/api/chat/chat-session-bootstrap?token={urllib.parse.quote(token)}"
-        return jsonify({"url": bootstrap_url})
+        return _json({"url": bootstrap_url})
 
     @app.route("/api/chat/chat-session-bootstrap", methods=["GET"])
     def api_chat_session_bootstrap():
         """URL target. Verifies token, sets session cookie, redirects to chatapp. For webapp/kiosk/mobile opening chat in a fresh webview."""
         token = (request.args.get("token") or "").strip()
         if not token:
-            return jsonify({"error": "token required"}), 400
+            return _err("token required", 400)
         payload = _verify_chat_entry_token(app.secret_key, token)
         if not payload:
-            return jsonify({"error": "Invalid or expired token"}), 403
+            return _err("Invalid or expired token", 403)
         chatapp_url = (os.environ.get("CHATAPP_URL") or request.url_root.rstrip("/")).rstrip("/")
         if not chatapp_url:
-            return (
-                jsonify(
-                    {"error": "CHATAPP_URL not configured; cannot redirect to chat"}
-                ),
-                503,
-            )
+            return _err("CHATAPP_URL not configured; cannot redirect to chat", 503)
         return redirect(chatapp_url + "/auth?token=" + urllib.parse.quote(token))
 
     calendar_svc = container.get_calendar_service()
@@ -312,14 +386,17 @@ def create_server_app(db_path=None):
     location_svc = container.get_location_service()
     emergency_svc = container.get_emergency_service()
     family_svc = container.get_family_service()
+    care_recipient_svc = container.get_care_recipient_service()
+    db = container.get_database_manager()
 
     def _parse_date_param():
         """Parse optional ?date=YYYY-MM-DD from request (TV's local date). Use for calendar 'current' endpoints."""
         s = request.args.get("date")
-        if not s:
+        m = _DATE_PARAM.fullmatch(s) if s else None
+        if not m:
             return None
         try:
-            return datetime.datetime.strptime(s, "%Y-%m-%d").date()
+            return datetime.date(int(m[1]), int(m[2]), int(m[3]))
         except ValueError:
             return None
 
@@ -328,14 +405,34 @@ def create_server_app(db_path=None):
         if family_circle_id != g.family_circle_id:
             abort(403, "family circle mismatch")
 
+    _calendar_cache = OrderedDict()  # full_path -> (expires_at, body bytes)
+    _calendar_cache_lock = threading.Lock()
+
+    def _cached_calendar_response(ttl, build):
+        """Serve a fresh cached body for this path, else build() it and cache it if 200."""
+        key = request.full_path
+        now = time.monotonic()
+        with _calendar_cache_lock:
+            hit = _calendar_cache.get(key)
+            if hit is not None and hit[0] > now:
+                _calendar_cache.move_to_end(key)
+                return app.response_class(hit[1], mimetype=_JSON_MIMETYPE)
+        resp = build()
+        if isinstance(resp, Response) and resp.status_code == 200:
+            with _calendar_cache_lock:
+                _calendar_cache[key] = (now + ttl, resp.get_data())
+                _calendar_cache.move_to_end(key)
+                if len(_calendar_cache) > _CALENDAR_CACHE_MAX:
+                    _calendar_cache.popitem(last=False)
+        return resp
+
     @app.route("/api/health")
     def api_health():
-        return jsonify({"status": "ok"})
+        return _json({"status": "ok"})
 
     @app.route("/api/users/<user_id>/photo")
     def api_serve_photo(user_id):
         """Serve user photo. User must be in requester's family. Rejects path traversal in filename."""
-        db = container.get_database_manager()
         r = db.execute_query(
             "SELECT u.photo_filename FROM users u "
             "INNER JOIN user_family_circle ufc ON u.id = ufc.user_id "
@@ -353,44 +450,60 @@ def create_server_app(db_path=None):
     @app.route("/api/family_circles/<family_circle_id>/calendar/headers")
     def api_calendar_headers(family_circle_id):
         _require_family_access(family_circle_id)
-        r = calendar_svc.get_day_headers()
-        if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+
+        def build():
+            r = calendar_svc.get_day_headers()
+            if not r.success:
+                return _err(r.error, 500)
+            return _ok(r.data)
+
+        return _cached_calendar_response(_CALENDAR_TTL_SEC, build)
 
     @app.route("/api/family_circles/<family_circle_id>/calendar/month")
     def api_calendar_month(family_circle_id):
         _require_family_access(family_circle_id)
-        ref = _parse_date_param()
-        r = calendar_svc.get_current_month_data(reference_date=ref)
-        if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+
+        def build():
+            ref = _parse_date_param()
+            r = calendar_svc.get_current_month_data(reference_date=ref)
+            if not r.success:
+                return _err(r.error, 500)
+            return _ok(r.data)
+
+        return _cached_calendar_response(_CALENDAR_TTL_SEC, build)
 
     @app.route("/api/family_circles/<family_circle_id>/calendar/date")
     def api_calendar_date(family_circle_id):
         _require_family_access(family_circle_id)
-        ref = _parse_date_param()
-        return jsonify({"data": calendar_svc.get_current_date(reference_date=ref)})
+
+        def build():
+            ref = _parse_date_param()
+            return _ok(calendar_svc.get_current_date(reference_date=ref))
+
+        return _cached_calendar_response(_CALENDAR_TTL_SEC, build)
 
     @app.route("/api/family_circles/<family_circle_id>/calendar/events")
     def api_calendar_events(family_circle_id):
         _require_family_access(family_circle_id)
         date = request.args.get("date")
         if not date:
-            return jsonify({"error": "missing date"}), 400
-        r = calendar_svc.get_events_for_date(date)
-        if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+            return _err("missing date", 400)
+
+        def build():
+            r = calendar_svc.get_events_for_date(date)
+            if not r.success:
+                return _err(r.error, 500)
+            return _ok(r.data)
+
+        return _cached_calendar_response(_CALENDAR_EVENTS_TTL_SEC, build)
 
     @app.route("/api/family_circles/<family_circle_id>/medications")
     def api_medications(family_circle_id):
         _require_family_access(family_circle_id)
         r = medication_svc.get_medication_data(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+            return _err(r.error, 500)
+        return _ok(r.data)
 
     @app.route("/api/family_circles/<family_circle_id>/contacts")
     def api_contacts(family_circle_id):
@@ -398,8 +511,8 @@ def create_server_app(db_path=None):
         _require_family_access(family_circle_id)
         r = contact_svc.get_all_contacts(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": [asdict(c) for c in (r.data or [])]})
+            return _err(r.error, 500)
+        return _ok(r.data or [])
 
     @app.route("/api/family_circles/<family_circle_id>/emergency-contacts")
     def api_emergency_contacts(family_circle_id):
@@ -407,27 +520,36 @@ def create_server_app(db_path=None):
         _require_family_access(family_circle_id)
         r = contact_svc.c_service_get_emergency_contacts(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": [asdict(c) for c in (r.data or [])]})
+            return _err(r.error, 500)
+        return _ok(r.data or [])
 
     @app.route("/api/family_circles/<family_circle_id>/medical-summary")
     def api_medical_summary(family_circle_id):
         _require_family_access(family_circle_id)
         r = emergency_svc.e_service_get_medical_summary(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+            return _err(r.error, 500)
+        return _ok(r.data)
 
     @app.route("/api/emergency/alert/status")
     def api_alert_status():
-        return jsonify({"data": {"activated": _alert_activated}})
+        return app.response_class(
+            _ALERT_BODIES[_alert_activated], mimetype=_JSON_MIMETYPE
+        )
 
     @app.route("/api/emergency/alert", methods=["POST"])
     def api_alert():
         global _alert_activated
         data = request.get_json() or {}
         _alert_activated = bool(data.get("activated", False))
-        return jsonify({"data": {"activated": _alert_activated}})
+        return app.response_class(
+            _ALERT_BODIES[_alert_activated], mimetype=_JSON_MIMETYPE
+        )
+
+    _profile_cache = {}  # family_circle_id -> (expires_at, body bytes); PUT drops the entry
+    # Bumped by every successful PUT: a GET that read the DB before the bump must not store
+    _profile_generation = {}  # family_circle_id -> int
+    _profile_cache_lock = threading.Lock()
 
     @app.route(
         "/api/family_circles/<family_circle_id>/emergency-profile",
@@ -436,10 +558,23 @@ def create_server_app(db_path=None):
     def api_emergency_profile(family_circle_id):
         _require_family_access(family_circle_id)
         if request.method == "GET":
+            now = time.monotonic()
+            with _profile_cache_lock:
+                hit = _profile_cache.get(family_circle_id)
+                if hit is not None and hit[0] > now:
+                    return app.response_class(hit[1], mimetype=_JSON_MIMETYPE)
+                generation = _profile_generation.get(family_circle_id, 0)
             r = emergency_svc.get_emergency_profile(family_circle_id)
             if not r.success:
-                return jsonify({"error": r.error}), 500
-            return jsonify({"data": r.data})
+                return _err(r.error, 500)
+            resp = _ok(r.data)
+            with _profile_cache_lock:
+                if _profile_generation.get(family_circle_id, 0) == generation:
+                    _profile_cache[family_circle_id] = (
+                        now + _EMERGENCY_PROFILE_TTL_SEC,
+                        resp.get_data(),
+                    )
+            return resp
 
         if (
             request.method != "PUT"
@@ -447,22 +582,26 @@ def create_server_app(db_path=None):
             return  # defensive
         data = request.get_json()
         if not data:
-            return jsonify({"error": "no data provided"}), 400
+            return _err("no data provided", 400)
         # TODO: why does emergency profile need to ever PUT or update care recipient?
-        care_recipient_svc = container.get_care_recipient_service()
         r = care_recipient_svc.update_care_recipient(family_circle_id, data)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+            return _err(r.error, 500)
+        with _profile_cache_lock:
+            _profile_generation[family_circle_id] = (
+                _profile_generation.get(family_circle_id, 0) + 1
+            )
+            _profile_cache.pop(family_circle_id, None)
+        return _ok(r.data)
 
     @app.route("/api/family_circles/<family_circle_id>/emergency-profile/pdf")
     def api_emergency_profile_pdf(family_circle_id):
         _require_family_access(family_circle_id)
         r = emergency_svc.get_emergency_profile(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
+            return _err(r.error, 500)
         if not r.data:
-            return jsonify({"error": "No emergency profile"}), 404
+            return _err("No emergency profile", 404)
         pdf_bytes = build_pdf(r.data)
         return Response(
             pdf_bytes,
@@ -473,7 +612,7 @@ def create_server_app(db_path=None):
     @app.route("/api/session")
     def api_session():
         """Return current session user_id and family_circle_id."""
-        return jsonify(
+        return _json(
             {
                 "user_id": g.user_id,
                 "family_circle_id": g.family_circle_id,
@@ -485,21 +624,21 @@ def create_server_app(db_path=None):
         """Fake login: set session from user_id and family_circle_id. For demo/simulated auth."""
         data = request.get_json()
         if not data:
-            return jsonify({"error": "no data provided"}), 400
+            return _err("no data provided", 400)
         user_id = data.get("user_id")
         family_circle_id = data.get("family_circle_id")
         if not user_id or not family_circle_id:
-            return jsonify({"error": "user_id and family_circle_id required"}), 400
+            return _err("user_id and family_circle_id required", 400)
         session["user_id"] = user_id
         session["family_circle_id"] = family_circle_id
         session["_sid"] = app.config.get("SESSION_SERVER_ID", "")
-        return jsonify({"ok": True})
+        return _json({"ok": True})
 
     @app.route("/api/logout", methods=["POST"])
     def api_logout():
         """Clear session. For switching users."""
         session.clear()
-        return jsonify({"ok": True})
+        return _json({"ok": True})
 
     @app.route("/checkin")
     def checkin_page():
@@ -520,14 +659,14 @@ def create_server_app(db_path=None):
         _require_family_access(family_circle_id)
         r = family_svc.get_family_members(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
+            return _err(r.error, 500)
         base = request.url_root.rstrip("/")
         members = [dict(m) for m in (r.data or [])]
         for m in members:
             m["photo_url"] = (
                 "%s/api/users/%s/photo" % (base, m["id"]) if m.get("id") else None
             )
-        return jsonify({"data": members})
+        return _ok(members)
 
     @app.route("/api/family_circles/<family_circle_id>/checkin", methods=["POST"])
     def api_create_checkin(family_circle_id):
@@ -537,7 +676,7 @@ def create_server_app(db_path=None):
         _require_family_access(family_circle_id)
         data = request.get_json()
         if not data:
-            return jsonify({"error": "no data provided"}), 400
+            return _err("no data provided", 400)
 
         user_id = data.get("user_id")
         latitude = data.get("latitude")
@@ -546,27 +685,24 @@ def create_server_app(db_path=None):
         # location_name is always resolved from GPS in create_checkin; never from client
 
         if not user_id or latitude is None or longitude is None:
-            return (
-                jsonify({"error": "user_id, latitude, and longitude are required"}),
-                400,
-            )
+            return _err("user_id, latitude, and longitude are required", 400)
         if user_id != g.user_id:
-            return jsonify({"error": "cannot check in for another user"}), 403
+            return _err("cannot check in for another user", 403)
 
         r = location_svc.create_checkin(
             family_circle_id, user_id, latitude, longitude, notes=notes
         )
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data}), 201
+            return _err(r.error, 500)
+        return _ok(r.data, 201)
 
     @app.route("/api/family_circles/<family_circle_id>/named-places")
     def api_get_named_places(family_circle_id):
         _require_family_access(family_circle_id)
         r = location_svc.get_named_places(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        return jsonify({"data": r.data})
+            return _err(r.error, 500)
+        return _ok(r.data)
 
     @app.route("/api/family_circles/<family_circle_id>/checkins")
     def api_get_checkins(family_circle_id):
@@ -575,13 +711,15 @@ def create_server_app(db_path=None):
         _require_family_access(family_circle_id)
         r = location_svc.get_checkins(family_circle_id)
         if not r.success:
-            return jsonify({"error": r.error}), 500
-        base = request.url_root.rstrip("/")
-        data = [dict(row) for row in (r.data or [])]
-        for row in data:
+            return _err(r.error, 500)
+        photo_base = request.url_root.rstrip("/") + "/api/users/"
+        data = []
+        for row in r.data or ():
+            row = dict(row)
             uid = row.get("user_id")
-            row["photo_url"] = "%s/api/users/%s/photo" % (base, uid) if uid else None
-        return jsonify({"data": data})
+            row["photo_url"] = "%s%s/photo" % (photo_base, uid) if uid else None
+            data.append(row)
+        return _ok(data)
 
     # Chatapp routes + static (webapp, chatapp) for Railway all-in-one deploy
     _src = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -589,8 +727,7 @@ def create_server_app(db_path=None):
     _chatapp_dist = os.path.join(_src, "apps", "chatapp", "chat_server", "dist")
     if os.path.isdir(_webapp_dist) and os.path.isdir(_chatapp_dist):
         sendbird_svc = container.get_sendbird_service()
-        db_manager = container.get_database_manager()
-        register_chatapp_routes(app, sendbird_svc, db_manager, chat_static_prefix="/chatapp")
+        register_chatapp_routes(app, sendbird_svc, db, chat_static_prefix="/chatapp")
 
         @app.route("/")
         @app.route("/index.html")
@@ -599,18 +736,24 @@ def create_server_app(db_path=None):
 
         @app.route("/login.html")
         def serve_login():
-            return send_from_directory(_webapp_dist, "login.html")
+            return send_from_directory(
+                _webapp_dist, "login.html", max_age=_STATIC_MAX_AGE_SEC
+            )
 
         @app.route("/app.js")
         def serve_app_js():
-            return send_from_directory(_webapp_dist, "app.js")
+            return send_from_directory(
+                _webapp_dist, "app.js", max_age=_STATIC_MAX_AGE_SEC
+            )
 
         @app.route("/chatapp/")
         @app.route("/chatapp/<path:path>")
         def serve_chat(path=""):
             if not path:
                 path = "poc_chat.html"
-            return send_from_directory(_chatapp_dist, path)
+            return send_from_directory(
+                _chatapp_dist, path, max_age=_STATIC_MAX_AGE_SEC
+            )
 
     return app
 
@@ -622,4 +765,6 @@ def run_server(host=None, port=None):
         raise RuntimeError("create_server_app() returned None")
     host = host if host is not None else get_server_host()
     port = port if port is not None else get_server_port()
-    app.run(host=host, port=port, debug=False)
+    # One process, one thread per request: alert state and the calendar cache live in this
+    # process, so extra worker processes would each see their own copy
+    app.run(host=host, port=port, debug=False, threaded=True)
@@ -85,3 +85,4 @@ class CareRecipientService(DatabaseServiceMixin):
             cid = f"poa_{family_circle_id}"
             if _ensure_contact(cid, poa_name or "", poa_phone):
                 _set_role("poa", cid)
+        return ServiceResult.success_result()
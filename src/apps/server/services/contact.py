@@ -31,6 +31,20 @@ class Contact:
     photo_filename: Optional[str] = None
     sendbird_user_id: Optional[str] = None
 
+    def to_dict(self):
+        """Same dict as dataclasses.asdict(self), without its recursive deep copy."""
+        return {
+            "id": self.id,
+            "display_name": self.display_name,
+            "phone": self.phone,
+            "email": self.email,
+            "birthday": self.birthday,
+            "relationship": self.relationship,
+            "emergency_priority": self.emergency_priority,
+            "photo_filename": self.photo_filename,
+            "sendbird_user_id": self.sendbird_user_id,
+        }
+
     def __str__(self):
         return f"{self.display_name} ({self.relationship}) - {self.phone}"
 
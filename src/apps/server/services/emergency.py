@@ -4,8 +4,6 @@ Emergency profile (first responder view), medical summary, and contacts.
 Composes from canonical sources: care_recipients, medications, allergies, conditions, contacts.
 """
 
-from dataclasses import asdict
-
 from ..database import DatabaseManager, DatabaseServiceMixin
 
 try:
@@ -126,7 +124,7 @@ class EmergencyService(DatabaseServiceMixin):
 
         ec_r = self.contact_service.c_service_get_emergency_contacts(family_circle_id)
         emergency_contacts = (
-            [asdict(c) for c in (ec_r.data or [])] if ec_r.success else []
+            [c.to_dict() for c in (ec_r.data or [])] if ec_r.success else []
         )
 
         data = {
@@ -8,6 +8,7 @@ API auth (from apps.server.api set_user_id / _require_family_access):
 - Both X-User-Id and X-Family-Circle-Id (or session): all other API routes. Family-scoped routes also require URL family_circle_id == header family.
 """
 
+import datetime
 import sys
 from pathlib import Path
 
@@ -196,6 +197,24 @@ def test_api_contacts_requires_auth(api_client):
     assert r.status_code == 401
 
 
+@pytest.mark.integration
+def test_api_contacts_serialize_every_contact_field(api_client):
+    """/contacts hands Contact dataclasses straight to app.json: the encoder's dataclass
+    support (orjson, or the stdlib provider's default()) must emit every field."""
+    from dataclasses import fields
+    from apps.server.services.contact import Contact
+
+    r = api_client.get(
+        "/api/family_circles/%s/contacts" % FAMILY_CIRCLE_ID, headers=API_HEADERS
+    )
+    assert r.status_code == 200
+    data = r.get_json()["data"]
+    assert data
+    expected = {f.name for f in fields(Contact)}
+    for contact in data:
+        assert set(contact) == expected
+
+
 # --- Security: session routes ---
 @pytest.mark.integration
 def test_checkin_page_redirects_to_login_without_session(api_client):
@@ -293,3 +312,93 @@ def test_api_calendar_headers(api_client):
     j = r.get_json()
     assert "data" in j
     assert j["data"] == ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+
+
+@pytest.mark.integration
+def test_api_calendar_month_cached_per_date(api_client):
+    """Cached calendar responses are keyed on the query string: each ?date= gets its own month."""
+    path = "/api/family_circles/%s/calendar/month" % FAMILY_CIRCLE_ID
+    jan = api_client.get(path + "?date=2024-01-15", headers=API_HEADERS)
+    feb = api_client.get(path + "?date=2024-02-15", headers=API_HEADERS)
+    jan_again = api_client.get(path + "?date=2024-01-15", headers=API_HEADERS)
+    assert jan.status_code == feb.status_code == jan_again.status_code == 200
+    assert jan_again.get_json() == jan.get_json()
+    assert feb.get_json() != jan.get_json()
+    assert jan.get_json()["data"][0] == [1, 2, 3, 4, 5, 6, 7]
+
+
+@pytest.mark.integration
+def test_api_calendar_date_param_forms(api_client):
+    """?date= accepts Y-M-D with or without leading zeros; malformed or impossible dates fall back."""
+    path = "/api/family_circles/%s/calendar/date" % FAMILY_CIRCLE_ID
+    for param, day in (("2024-01-05", 5), ("2024-1-5", 5), ("2024-02-29", 29)):
+        r = api_client.get(path + "?date=" + param, headers=API_HEADERS)
+        assert r.get_json()["data"] == day, param
+    today = datetime.date.today().day
+    for param in ("2024-02-30", "20240105", "2024-01-05T00:00", "x"):
+        r = api_client.get(path + "?date=" + param, headers=API_HEADERS)
+        assert r.get_json()["data"] == today, param
+
+
+@pytest.mark.integration
+def test_api_alert_status_round_trip(api_client):
+    """POST /api/emergency/alert flips the flag that /alert/status reports."""
+    try:
+        r = api_client.post(
+            "/api/emergency/alert", json={"activated": True}, headers=API_HEADERS
+        )
+        assert r.status_code == 200
+        assert r.get_json() == {"data": {"activated": True}}
+        r = api_client.get("/api/emergency/alert/status", headers=API_HEADERS)
+        assert r.is_json
+        assert r.get_json() == {"data": {"activated": True}}
+    finally:
+        api_client.post(
+            "/api/emergency/alert", json={"activated": False}, headers=API_HEADERS
+        )
+    r = api_client.get("/api/emergency/alert/status", headers=API_HEADERS)
+    assert r.get_json() == {"data": {"activated": False}}
+
+
+@pytest.mark.integration
+def test_api_emergency_profile_put_refreshes_cached_get(api_client):
+    """A cached emergency-profile GET reflects a PUT made through the API."""
+    path = "/api/family_circles/%s/emergency-profile" % FAMILY_CIRCLE_ID
+    r = api_client.get(path, headers=API_HEADERS)
+    assert r.status_code == 200
+    assert r.get_json()["data"]["profile"]["name"] == "Care Recipient"
+    r = api_client.put(
+        path,
+        json={"user_id": CARE_RECIPIENT_USER_ID, "profile": {"name": "Renamed"}},
+        headers=API_HEADERS,
+    )
+    assert r.status_code == 200
+    r = api_client.get(path, headers=API_HEADERS)
+    assert r.get_json()["data"]["profile"]["name"] == "Renamed"
+
+
+@pytest.mark.integration
+def test_api_emergency_profile_get_racing_put_is_not_cached(api_client):
+    """A GET that read the profile before a concurrent PUT must not cache its stale body."""
+    path = "/api/family_circles/%s/emergency-profile" % FAMILY_CIRCLE_ID
+    emergency_svc = api_client.application.config["container"].get_emergency_service()
+    read_profile = emergency_svc.get_emergency_profile
+
+    def read_then_put(family_circle_id):
+        result = read_profile(family_circle_id)
+        # PUT lands between this GET's DB read and its cache store
+        r = api_client.put(
+            path,
+            json={"user_id": CARE_RECIPIENT_USER_ID, "profile": {"name": "Renamed"}},
+            headers=API_HEADERS,
+        )
+        assert r.status_code == 200
+        return result
+
+    emergency_svc.get_emergency_profile = read_then_put
+    r = api_client.get(path, headers=API_HEADERS)
+    assert r.get_json()["data"]["profile"]["name"] == "Care Recipient"
+    del emergency_svc.get_emergency_profile
+
+    r = api_client.get(path, headers=API_HEADERS)
+    assert r.get_json()["data"]["profile"]["name"] == "Renamed"
@@ -0,0 +1,15 @@
+"""
+Unit tests for the Contact model (no DB). Serialization used by the emergency profile.
+"""
+
+from dataclasses import asdict, fields
+
+import pytest
+from apps.server.services.contact import Contact
+
+
+@pytest.mark.unit
+def test_contact_to_dict_matches_asdict():
+    """Contact.to_dict() (emergency profile contacts) lists every field, in asdict's order."""
+    contact = Contact(**{f.name: "v_" + f.name for f in fields(Contact)})
+    assert list(contact.to_dict().items()) == list(asdict(contact).items())
@@ -53,6 +53,11 @@ def get_update_interval() -> float:
     return float(os.getenv("UPDATE_INTERVAL", "1.0"))
 
 
+def get_debug_borders() -> bool:
+    """Draw kiosk layout debug borders. Off by default; set DEBUG_BORDERS=1 to enable."""
+    return os.getenv("DEBUG_BORDERS", "0").strip() == "1"
+
+
 # Server bind address: single source of truth for host/port (env SERVER_HOST, PORT).
 def get_server_host() -> str:
     """Host the API server binds to. Default 0.0.0.0."""
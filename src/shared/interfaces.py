@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Any, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceResult:
     """Standard result wrapper for service operations."""
 